@@ -157,12 +157,13 @@ class Cab(Cargo):
 
 
     def summary(self, params=None, recursive=True, ignore_missing=False):
-        lines = [f"cab {self.name}:"] 
+        """Yields lines with a summary of the cab state"""
+        yield f"cab {self.name}:"
         if params is not None:
-            Cargo.add_parameter_summary(params, lines)
-            lines += [f"  {name} = ???" for name, schema in self.inputs_outputs.items()
-                        if name not in params and (not ignore_missing or schema.required)]
-        return lines
+            yield from Cargo.add_parameter_summary(params)
+            for name, schema in self.inputs_outputs.items():
+                if name not in params and (not ignore_missing or schema.required):
+                    yield f"  {name} = ???"
 
     def rich_help(self, tree, max_category=ParameterCategory.Optional):
         tree.add(f"command: {self.command}")
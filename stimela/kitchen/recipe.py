@@ -367,7 +367,7 @@ class Recipe(Cargo):
             tags, skip_tags, step_ranges, skip_ranges, enable_steps = subrecipe_entries.get(None, ([],[],[],[],[]))
 
             # Check that all specified tags (if any), exist.
-            known_tags = set.union(*([v.tags for v in self.steps.values()] or [set()]))
+            known_tags = set().union(*(v.tags for v in self.steps.values()))
             unknown_tags = (set(tags) | set(skip_tags)) - known_tags
             if unknown_tags:
                 unknown_tags = "', '".join(unknown_tags)
@@ -1001,18 +1001,21 @@ class Recipe(Cargo):
     #             step.previous_step = steps[i-2]
 
     def summary(self, params: Dict[str, Any], recursive=True, ignore_missing=False):
-        """Returns list of lines with a summary of the recipe state
+        """Yields lines with a summary of the recipe state
         """
-        lines = [f"recipe '{self.name}':"] + Cargo.add_parameter_summary(params)
+        yield f"recipe '{self.name}':"
+        yield from Cargo.add_parameter_summary(params)
         if not ignore_missing:
-            lines += [f"  {name} = ???" for name in self.inputs_outputs if name not in params]
+            for name in self.inputs_outputs:
+                if name not in params:
+                    yield f"  {name} = ???"
         if recursive:
-            lines.append("  steps:")
+            yield "  steps:"
             for name, step in self.steps.items():
                 stepsum = step.summary()
-                lines.append(f"    {name}: {stepsum[0]}")
-                lines += [f"    {x}" for x in stepsum[1:]]
-        return lines
+                yield f"    {name}: {next(stepsum, '')}"
+                for x in stepsum:
+                    yield f"    {x}"
 
     _root_recipe_ns = None
 
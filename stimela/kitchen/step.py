@@ -1,4 +1,4 @@
-import os, os.path, re, logging, copy, shutil, time
+import os, os.path, re, sys, logging, copy, shutil, time, weakref
 from typing import Any, Tuple, List, Dict, Optional, Union
 from dataclasses import dataclass
 from omegaconf import MISSING, OmegaConf, DictConfig, ListConfig
@@ -23,9 +23,13 @@ from .cab import Cab, get_cab_schema
 Conditional = Optional[str]
 
 
-def resolve_dotted_reference(key, base, current, context): 
-    """helper function to look up a key like a.b.c in a nested dict-like structure"""
-    path = key.split('.')
+def resolve_dotted_reference(key: Union[str, Tuple[str, ...]], base, current, context): 
+    """helper function to look up a key like a.b.c in a nested dict-like structure. The key may also be 
+    given as a tuple of pre-split path elements"""
+    if type(key) is tuple:
+        path, key = key, '.'.join(key)
+    else:
+        path = key.split('.')
     if path[0]:
         section = base
     else:
@@ -48,8 +52,59 @@ def resolve_dotted_reference(key, base, current, context):
 OUTPUTS_EXISTS = "exist"
 OUTPUTS_FRESH = "fresh"
 
-@dataclass
-class Step:
+def _missing_params(io: Dict[str, Any], validated: Dict[str, Any]):
+    """Returns dict of required parameters in schema dict io that are missing from validated"""
+    return {name: schema for name, schema in io.items() if schema.required and name not in validated}
+
+_BAD_TYPES = (scabha.exceptions.Error, Unresolved)
+
+def _bad_params(validated: Dict[str, Any]):
+    """Does a single pass over validated parameters. Returns lists of invalid (set to errors), unresolved 
+    (but not placeholders), and bad (i.e. either invalid or unresolved) parameters"""
+    invalid, unresolved, bad = [], [], []
+    for name, value in validated.items():
+        if isinstance(value, _BAD_TYPES):
+            if isinstance(value, scabha.exceptions.Error):
+                invalid.append(name)
+            elif not isinstance(value, Placeholder):
+                unresolved.append(name)
+            else:
+                continue
+            bad.append(name)
+    return invalid, unresolved, bad
+
+# maps id of a nested recipe's DictConfig to (weakref to DictConfig, DictConfig merged with RecipeSchema)
+_merged_recipe_cache: Dict[int, Tuple[weakref.ref, DictConfig]] = {}
+
+def _merge_recipe_schema(conf: DictConfig, schema: DictConfig):
+    """Merges nested recipe config with the recipe schema. The merge is only done once per config object, 
+    subsequent calls return a copy of the cached result (since Recipe objects will modify their config)"""
+    key = id(conf)
+    entry = _merged_recipe_cache.get(key)
+    if entry is None or entry[0]() is not conf:
+        merged = OmegaConf.unsafe_merge(schema.copy(), conf)
+        ref = weakref.ref(conf, lambda _, key=key: _merged_recipe_cache.pop(key, None))
+        entry = _merged_recipe_cache[key] = ref, merged
+    return copy.deepcopy(entry[1])
+
+# shared tag set of all untagged steps
+_NO_TAGS = frozenset()
+
+# constant settings of the skip attribute
+_SKIP_TRUE = frozenset({"True", "true", "1"})
+_SKIP_FALSE = frozenset({"False", "false", "0", "", None})
+
+class _StepState(object):
+    """Slots for the runtime (i.e. non-config) attributes of a Step. Scattered loops send steps to worker processes
+    via the standard pickle module, so these must only ever hold picklable objects (no closures or lambdas)"""
+    __slots__ = ('cargo', 'config', 'validated_params', '_assignment_overrides',
+                 '_defaults', '_err_prefix', '_recipe_path', '_skip')
+
+# dataclasses can only be slotted from Python 3.10 on -- on older versions, only the runtime attributes are slotted
+_DATACLASS_SLOTS = dict(slots=True) if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
+class Step(_StepState):
     """Represents one processing step of a recipe"""
     cab: Optional[Any] = None                       # if not None, this step is a cab and this is the cab name
     recipe: Optional[Any] = None                    # if not None, this step is a nested recipe
@@ -71,19 +126,27 @@ class Step:
     backend: Optional[Dict[str, Any]] = None
 
     def __post_init__(self):
-        self.fqname = self.fqname or self.name
+        self.fqname = sys.intern(self.fqname or self.name)
+        # prefix for error messages (reset in finalize(), since the name may be changed after construction)
+        self._err_prefix = f"step '{self.name}'"
         if not bool(self.cab) and not bool(self.recipe):
-            raise StepValidationError(f"step '{self.name}': step must specify either a cab or a nested recipe")
+            raise StepValidationError(f"{self._err_prefix}: step must specify either a cab or a nested recipe")
         if bool(self.cab) == bool(self.recipe):
-            raise StepValidationError(f"step '{self.name}': step can't specify both a cab and a nested recipe")
+            raise StepValidationError(f"{self._err_prefix}: step can't specify both a cab and a nested recipe")
+        # pre-split dotted recipe references, so that they needn't be parsed again on lookup
+        if type(self.recipe) is str and '.' in self.recipe:
+            self._recipe_path = tuple(sys.intern(element) for element in self.recipe.split('.'))
+        else:
+            self._recipe_path = None
         self.cargo = self.config = None
-        self.tags = set(self.tags)
+        self._defaults = None
+        self.tags = frozenset(self.tags) if self.tags else _NO_TAGS
         # check backend setting
         if self.backend:
             try:
                 OmegaConf.merge(StimelaBackendSchema, self.backend)
             except OmegaConfBaseException as exc:
-                raise StepValidationError(f"step '{self.name}': invalid backend setting", exc)
+                raise StepValidationError(f"{self._err_prefix}: invalid backend setting", exc)
         # convert params into standard dict, else lousy stuff happens when we insert non-standard objects
         if isinstance(self.params, DictConfig):
             self.params = OmegaConf.to_container(self.params)
@@ -92,26 +155,29 @@ class Step:
         # parameters protected from assignment (because they've been set on the command line, presumably)
         self._assignment_overrides = set()
         if self.skip_if_outputs and self.skip_if_outputs not in (OUTPUTS_EXISTS, OUTPUTS_FRESH):
-            raise StepValidationError(f"step '{self.name}': invalid 'skip_if_outputs={self.skip_if_outputs}' setting")
+            raise StepValidationError(f"{self._err_prefix}: invalid 'skip_if_outputs={self.skip_if_outputs}' setting")
         # the "skip" attribute is reevaluated at runtime since it may contain substitutions, but if it's set to a bool
         # constant, self._skip will be preset already
         # validate skip attribute
-        if self.skip in {"True", "true", "1"}:
+        if self.skip in _SKIP_TRUE:
             self._skip = True
-        elif self.skip in {"False", "false", "0", "", None}:
+        elif self.skip in _SKIP_FALSE:
             self._skip = False
         else:
             # otherwise, self._skip stays at None, and will be re-evaluated at runtime
             self._skip = None
         
     def summary(self, params=None, recursive=True, ignore_missing=False, inputs=True, outputs=True):
+        """Yields lines with a summary of the step state. Nothing is computed until the lines are consumed"""
+        if not self.cargo:
+            return
         summary_params = OrderedDict()
         for name, value in (params or self.validated_params or self.params).items():
             schema = self.cargo.inputs_outputs[name]
             if (inputs and (schema.is_input or schema.is_named_output)) or \
                 (outputs and schema.is_output):
                 summary_params[name] = value
-        return self.cargo and self.cargo.summary(recursive=recursive, params=summary_params, ignore_missing=ignore_missing)
+        yield from self.cargo.summary(recursive=recursive, params=summary_params, ignore_missing=ignore_missing)
 
     @property
     def finalized(self):
@@ -119,16 +185,30 @@ class Step:
 
     @property
     def missing_params(self):
-        return OrderedDict([(name, schema) for name, schema in self.cargo.inputs_outputs.items() 
-                            if schema.required and name not in self.validated_params])
+        return _missing_params(self.cargo.inputs_outputs, self.validated_params)
 
     @property
     def invalid_params(self):
-        return [name for name, value in self.validated_params.items() if isinstance(value, scabha.exceptions.Error)]
+        return _bad_params(self.validated_params)[0]
 
     @property
     def unresolved_params(self):
-        return [name for name, value in self.validated_params.items() if isinstance(value, Unresolved) and not isinstance(value, Placeholder)]
+        return _bad_params(self.validated_params)[1]
+
+    @property
+    def bad_params(self):
+        """Invalid and unresolved parameters, in order of appearance"""
+        return _bad_params(self.validated_params)[2]
+
+    @property
+    def defaults(self):
+        """Dictionary of default parameter values from cargo, built on first access"""
+        if self._defaults is None:
+            unset, unresolved = UNSET, Unresolved
+            self._defaults = {name: schema.default for name, schema in self.cargo.inputs_outputs.items() 
+                              if schema.default is not unset and not isinstance(schema.default, unresolved) }
+            self._defaults.update(self.cargo.defaults)
+        return self._defaults
 
     @property
     def inputs(self):
@@ -175,13 +255,27 @@ class Step:
         if isinstance(self.cargo, Recipe):
             self.cargo.update_log_options(**options)
 
-    _instantiated_cabs = {}
+    # maps cab name to an attribute snapshot of a Cab instantiated from config.cabs
+    _cab_prototypes = {}
+
+    @classmethod
+    def _instantiate_cab(cls, name: str, config):
+        """Returns a new Cab object for a named cab in config.cabs. The cab is only constructed once,
+        subsequent instances are stamped out from an attribute snapshot of the prototype. Like copy.copy(),
+        this is a shallow copy: the attribute values are shared."""
+        snapshot = cls._cab_prototypes.get(name)
+        if snapshot is None:
+            snapshot = cls._cab_prototypes[name] = dict(Cab(**config.cabs[name]).__dict__)
+        cab = Cab.__new__(Cab)
+        cab.__dict__.update(snapshot)
+        return cab
 
     def finalize(self, config=None, log=None, fqname=None, backend=None, nesting=0):
         from .recipe import Recipe, RecipeSchema
         if not self.finalized:
             if fqname is not None:
-                self.fqname = fqname
+                self.fqname = sys.intern(fqname)
+            self._err_prefix = f"step '{self.name}'"
             self.config = config = config or stimela.CONFIG
 
             # if recipe, validate the recipe with our parameters
@@ -197,7 +291,7 @@ class Step:
                         self.recipe = self.config.lib.recipes[self.recipe]
                     # dotted name -- look in config
                     else: 
-                        section, var = resolve_dotted_reference(self.recipe, config, current=None, context=f"step '{self.name}'")
+                        section, var = resolve_dotted_reference(self._recipe_path, config, current=None, context=self._err_prefix)
                         if var not in section:
                             raise StepValidationError(f"recipe '{self.recipe}' not found")
                         self.recipe = section[var]
@@ -205,7 +299,7 @@ class Step:
                 # instantiate from omegaconf object, if needed
                 if type(self.recipe) is DictConfig:
                     try:
-                        self.recipe = Recipe(**OmegaConf.unsafe_merge(RecipeSchema.copy(), self.recipe))
+                        self.recipe = Recipe(**_merge_recipe_schema(self.recipe, RecipeSchema))
                     except OmegaConfBaseException as exc:
                         raise StepValidationError(f"error in recipe '{recipe_name}", exc)
                 elif not isinstance(self.recipe, Recipe):
@@ -213,16 +307,12 @@ class Step:
                 self.cargo = self.recipe
             else:
                 if type(self.cab) is str:
-                    if self.cab in self._instantiated_cabs:
-                        self.cargo = copy.copy(self._instantiated_cabs[self.cab])
-                    else:
-                        if self.cab not in self.config.cabs:
-                            raise StepValidationError(f"unknown cab '{self.cab}'")
-                        try:
-                            self._instantiated_cabs[self.cab] = Cab(**config.cabs[self.cab])
-                            self.cargo = copy.copy(self._instantiated_cabs[self.cab])
-                        except Exception as exc:
-                            raise StepValidationError(f"error in cab '{self.cab}'", exc)
+                    if self.cab not in self._cab_prototypes and self.cab not in self.config.cabs:
+                        raise StepValidationError(f"unknown cab '{self.cab}'")
+                    try:
+                        self.cargo = self._instantiate_cab(self.cab, config)
+                    except Exception as exc:
+                        raise StepValidationError(f"error in cab '{self.cab}'", exc)
                 else:
                     if type(self.cab) is DictConfig:
                         cab_name = f"{self.fqname}:cab"
@@ -237,7 +327,7 @@ class Step:
 
             # flatten parameters
             self.cargo.apply_dynamic_schemas(self.params)
-            self.params = self.cargo.flatten_param_dict(OrderedDict(), self.params)
+            self.params = self.cargo.flatten_param_dict({}, self.params)
 
             # if logger is not provided, then init one
             if log is None:
@@ -247,15 +337,13 @@ class Step:
             # finalize the cargo
             self.cargo.finalize(config, log=log, fqname=self.fqname, backend=backend, nesting=nesting)
 
-            # build dictionary of defaults from cargo
-            self.defaults = {name: schema.default for name, schema in self.cargo.inputs_outputs.items() 
-                             if schema.default is not UNSET and not isinstance(schema.default, Unresolved) }
-            self.defaults.update(**self.cargo.defaults)
-            
-            # set missing parameters from defaults
-            for name, value in self.defaults.items():
-                if name not in self.params:
-                    self.params[name] = value
+            # set missing parameters from defaults, if there are any. Params are merged back in on top,
+            # so that they keep both their values and their order
+            if not (self.cargo.inputs_outputs.keys() <= self.params.keys() and 
+                    self.cargo.defaults.keys() <= self.params.keys()):
+                params = self.params | self.defaults
+                params.update(self.params)
+                self.params = params
 
             # check for valid backend
             backend_opts = OmegaConf.to_object(OmegaConf.merge(
@@ -281,11 +369,13 @@ class Step:
         for name in self.cargo.outputs:
             if name not in params:
                 params[name] = UNSET(name)
-        self.log.debug(f"{self.cargo.name}: {len(self.missing_params)} missing, "
-                        f"{len(self.invalid_params)} invalid and "
-                        f"{len(self.unresolved_params)} unresolved parameters")
-        if self.invalid_params:
-            raise StepValidationError(f"step '{self.name}': {self.cargo.name} has the following invalid parameters: {join_quote(self.invalid_params)}")
+        invalid, unresolved, _ = _bad_params(params)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(f"{self.cargo.name}: {len(self.missing_params)} missing, "
+                            f"{len(invalid)} invalid and "
+                            f"{len(unresolved)} unresolved parameters")
+        if invalid:
+            raise StepValidationError(f"{self._err_prefix}: {self.cargo.name} has the following invalid parameters: {join_quote(invalid)}")
         return params
 
     def log_summary(self, level, title, color=None, ignore_missing=True, inputs=False, outputs=False):
@@ -298,6 +388,17 @@ class Step:
     def log_exception(self, exc, severity="error", log=None):
         log_exception(exc, severity=severity, log=log or self.log)
 
+    def _log_validation_error(self, exc: ScabhaBaseException, kind: str, skip: bool):
+        """Logs an exception raised when validating inputs or outputs (kind), unless it has already been logged.
+        Errors are logged as warnings if the step is being skipped."""
+        if not exc.logged:
+            severity = "warning" if skip else "error"
+            if type(exc) is SubstitutionErrorList:
+                self.log_exception(StepValidationError(f"unresolved {{}}-substitution(s) in {kind}:", exc.nested), severity=severity)
+            else:
+                self.log_exception(StepValidationError(f"error validating {kind}:", exc), severity=severity)
+            exc.logged = True
+
     def assign_value(self, key: str, value: Any, override: bool = False):
         """assigns parameter value or nested variable value to this step
 
@@ -354,6 +455,22 @@ class Step:
                 return backend_runner.build(self.cargo, log=log, rebuild=rebuild)
 
 
+    # maps cargo type to the method that runs it. Populated on the first call to run(), since
+    # Recipe can't be imported at module level
+    _run_dispatch = None
+
+    def _run_recipe(self, params, subst, backend, backend_runner):
+        self.cargo._run(params, subst, backend=backend)
+
+    def _run_cab(self, params, subst, backend, backend_runner):
+        cabstat = backend_runner.run(self.cargo, params=params, log=self.log, subst=subst, fqname=self.fqname)
+        # check for runstate
+        if cabstat.success is False:
+            raise StimelaCabRuntimeError(f"error running cab '{self.cargo.name}'", cabstat.errors)
+        for msg in cabstat.warnings:
+            self.log.warning(f"cab '{self.cargo.name}': {msg}")
+        params.update(**cabstat.outputs)
+
     def run(self, backend: Optional[Dict] = None, subst: Optional[Dict[str, Any]] = None, 
             is_outer_step: bool=False,
             parent_log: Optional[logging.Logger] = None) -> Dict[str, Any]:
@@ -376,13 +493,18 @@ class Step:
             Dict[str, Any]: step outputs
         """
 
-        from .recipe import Recipe
+        if Step._run_dispatch is None:
+            from .recipe import Recipe
+            Step._run_dispatch = {Recipe: Step._run_recipe, Cab: Step._run_cab}
 
         # some messages go to the parent logger -- if not defined, default to our own logger
         if parent_log is None:
             parent_log = self.log
 
-        backend = OmegaConf.merge(backend or {}, self.cargo.backend or {}, self.backend or {})
+        # cargo does not change during the run, so bind it (and, after prevalidation, its schemas) locally
+        cargo = self.cargo
+
+        backend = OmegaConf.merge(backend or {}, cargo.backend or {}, self.backend or {})
 
         # validate backend settings
         try:
@@ -405,11 +527,12 @@ class Step:
             parent_log_info = parent_log_warning = parent_log.debug
         else:
             context = task_stats.declare_subtask(self.name, hide_local_metrics=backend_runner.is_remote)
-            stimelogging.declare_chapter(f"{self.fqname}")
+            stimelogging.declare_chapter(self.fqname)
             parent_log_info, parent_log_warning = parent_log.info, parent_log.warning
 
         if self.validated_params is None:
             self.prevalidate(self.params)
+        io, outputs = cargo.inputs_outputs, cargo.outputs
 
         with context:
             # evaluate the skip attribute (it can be a formula and/or a {}-substititon)
@@ -418,7 +541,8 @@ class Step:
                 skip = evaluate_and_substitute_object(self.skip, subst, location=[self.fqname, "skip"])
                 if skip is UNSET:  # skip: =IFSET(recipe.foo) will return UNSET
                     skip = False
-                self.log.debug(f"dynamic skip attribute evaluation returns {skip}")
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug(f"dynamic skip attribute evaluation returns {skip}")
                 # formulas with unset variables return UNSET instance
                 if isinstance(skip, UNSET):
                     if skip.errors:
@@ -429,32 +553,25 @@ class Step:
             # Since prevalidation will have populated default values for potentially missing parameters, use those values
             # For parameters that aren't missing, use whatever value that was suplied
             # preserve order of specified params, to allow ordered substitutions to occur
+            # (a ChainMap won't do here: validate_inputs() needs a real dict, and would see the wrong order)
             params = self.params.copy()
-            params.update([(key, value) for key, value in self.validated_params.items() if key not in params])
+            for key, value in self.validated_params.items():
+                params.setdefault(key, value)
 
             skip_warned = False   # becomes True when warnings are given
 
-            self.log.debug(f"validating inputs {subst and list(subst.keys())}")
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(f"validating inputs {subst and list(subst.keys())}")
             validated = None
             try:
-                params = self.cargo.validate_inputs(params, loosely=skip, remote_fs=backend_runner.is_remote_fs, subst=subst)
+                params = cargo.validate_inputs(params, loosely=skip, remote_fs=backend_runner.is_remote_fs, subst=subst)
                 validated = True
 
             except ScabhaBaseException as exc:
-                severity = "warning" if skip else "error"
-                level = logging.WARNING if skip else logging.ERROR
-                if not exc.logged and not explicit_skip:
-                    if type(exc) is SubstitutionErrorList:
-                        self.log_exception(StepValidationError(f"unresolved {{}}-substitution(s) in inputs:", exc.nested), 
-                                           severity=severity)
-                        # for err in exc.errors:
-                        #     self.log.log(level, f"  {err}")
-                    else:
-                        self.log_exception(StepValidationError(f"error validating inputs:", exc), 
-                                           severity=severity)
-                    exc.logged = True
                 if not explicit_skip:
-                    self.log_summary(level, "summary of inputs follows", color="WARNING", inputs=True)
+                    self._log_validation_error(exc, "inputs", skip)
+                    self.log_summary(logging.WARNING if skip else logging.ERROR, "summary of inputs follows", 
+                                     color="WARNING", inputs=True)
                 # raise up, unless step is being skipped
                 if skip:
                     parent_log_warning("since the step is being skipped, this is not fatal")
@@ -472,11 +589,10 @@ class Step:
 
             ## check for (a) invalid params (b) unresolved inputs 
             # (c) unresolved outputs of File/MS/Directory type 
-            invalid = self.invalid_params
-            for name in self.unresolved_params:
-                schema = self.cargo.inputs_outputs[name]
-                if schema.is_input or schema.is_named_output:
-                    invalid.append(name)
+            validated_params = self.validated_params
+            invalid = [name for name in self.bad_params 
+                       if isinstance(validated_params[name], scabha.exceptions.Error) or 
+                            io[name].is_input or io[name].is_named_output]
             if invalid:
                 if skip:
                     parent_log_warning(f"invalid inputs: {join_quote(invalid)}")
@@ -484,7 +600,7 @@ class Step:
                         parent_log_warning("since the step was skipped, this is not fatal")
                         skip_warned = True
                 else:
-                    raise StepValidationError(f"step '{self.name}': invalid inputs: {join_quote(invalid)}", log=self.log)
+                    raise StepValidationError(f"{self._err_prefix}: invalid inputs: {join_quote(invalid)}", log=self.log)
 
             ## check if we need to skip based on existing/fresh file outputs
             ## if skip on fresh outputs is in effect, find mtime of most recent input 
@@ -494,7 +610,7 @@ class Step:
                 if self.skip_if_outputs == OUTPUTS_FRESH:
                     parent_log_info("checking if file-type outputs of step are fresh")
                     for name, value in params.items():
-                        schema = self.inputs_outputs[name]
+                        schema = io[name]
                         if schema.is_input and not schema.skip_freshness_checks:
                             if schema.is_file_type:
                                 values = [value]
@@ -516,7 +632,7 @@ class Step:
                 ## now go through outputs -- all_exist flag will be cleared if we find one that doesn't exist,
                 ## or is older than an input
                 all_exist = True
-                for name, schema in self.outputs.items():
+                for name, schema in outputs.items():
                     # ignore outputs not in params (implicit outputs will be already in there thanks to validation above)
                     if name in params:
                         # check for files or lists of files, and skip otherwise
@@ -579,7 +695,7 @@ class Step:
             if not skip:
                 # check for outputs that need removal
                 if not backend_runner.is_remote_fs:
-                    for name, schema in self.outputs.items():
+                    for name, schema in outputs.items():
                         if name in params and schema.remove_if_exists and schema.is_file_type:
                             path = params[name]
                             if type(path) is str and os.path.exists(path):
@@ -588,46 +704,29 @@ class Step:
                                 else:
                                     os.unlink(path)
 
-                if type(self.cargo) is Recipe:
-                    self.cargo._run(params, subst, backend=backend)
-                elif type(self.cargo) is Cab:
-                    cabstat = backend_runner.run(self.cargo, params=params, log=self.log, subst=subst, fqname=self.fqname)
-                    # check for runstate
-                    if cabstat.success is False:
-                        raise StimelaCabRuntimeError(f"error running cab '{self.cargo.name}'", cabstat.errors)
-                    for msg in cabstat.warnings:
-                        self.log.warning(f"cab '{self.cargo.name}': {msg}")
-                    params.update(**cabstat.outputs)
-                else:
-                    raise RuntimeError("step '{self.name}': unknown cargo type")
+                run_cargo = self._run_dispatch.get(type(cargo))
+                if run_cargo is None:
+                    raise RuntimeError(f"{self._err_prefix}: unknown cargo type")
+                run_cargo(self, params, subst, backend, backend_runner)
             else:
                 if self._skip is None and subst is not None:
                     parent_log_info(f"skipping step based on conditonal settings")
                 else:
                     parent_log.debug("skipping step based on explicit setting")
 
-            self.log.debug(f"validating outputs")
+            self.log.debug("validating outputs")
             validated = False
 
             try:
-                params = self.cargo.validate_outputs(params, loosely=skip,remote_fs=backend_runner.is_remote_fs, subst=subst)
+                params = cargo.validate_outputs(params, loosely=skip,remote_fs=backend_runner.is_remote_fs, subst=subst)
                 validated = True
             except ScabhaBaseException as exc:
-                severity = "warning" if skip else "error"
-                level = logging.WARNING if self.skip else logging.ERROR
-                if not exc.logged:
-                    if type(exc) is SubstitutionErrorList:
-                        self.log_exception(StepValidationError(f"unresolved {{}}-substitution(s) in outputs:", exc.nested), severity=severity)
-                        # for err in exc.errors:
-                        #     self.log.log(level, f"  {err}")
-                    else:
-                        self.log_exception(StepValidationError(f"error validating outputs:", exc), severity=severity)
-                    exc.logged = True
+                self._log_validation_error(exc, "outputs", skip)
                 # raise up, unless step is being skipped
                 if skip:
                     self.log.warning("since the step was skipped, this is not fatal")
                 else:
-                    self.log_summary(level, "failed outputs", color="WARNING", inputs=False, outputs=True)
+                    self.log_summary(logging.ERROR, "failed outputs", color="WARNING", inputs=False, outputs=True)
                     raise
 
             if validated:
@@ -637,8 +736,8 @@ class Step:
                 self.log_summary(logging.DEBUG, "validated outputs", ignore_missing=True, outputs=True)
 
             # bomb out if an output was invalid
-            invalid = [name for name in self.invalid_params + self.unresolved_params 
-                        if name in self.cargo.outputs and self.cargo.outputs[name].required is not False]
+            invalid = [name for name in self.bad_params 
+                        if name in outputs and outputs[name].required is not False]
             if invalid:
                 if skip:
                     parent_log_warning(f"invalid outputs: {join_quote(invalid)}")
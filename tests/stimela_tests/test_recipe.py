@@ -108,3 +108,23 @@ def test_scatter():
     print("===== expecting no errors now =====")
     retcode = os.system("stimela -v -b native exec test_scatter.yml nested_loop")
     assert retcode == 0
+
+    print("===== expecting no errors now =====")
+    retcode = os.system("stimela -v -b native exec test_scatter.yml skip_loop")
+    assert retcode == 0
+
+    print("===== expecting no errors now =====")
+    retcode = os.system("stimela -v -b native exec test_scatter.yml skip_loop flag=false")
+    assert retcode == 0
+
+def test_step_params_from_config():
+    from omegaconf import OmegaConf
+    from stimela.kitchen.step import Step
+    conf = OmegaConf.create(dict(cab="echo", params=dict(a="???", b="${foo.bar}", c=dict(x=1))))
+    step = Step(**conf)
+    # params are converted to a plain dict, without resolving interpolations or missing values
+    assert type(step.params) is dict
+    assert "a" in step.params and step.params["a"] == "???"
+    assert step.params["b"] == "${foo.bar}"
+    assert step.params["c"] == {"x": 1} and type(step.params["c"]) is dict
+    assert step == Step(**conf)